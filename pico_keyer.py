@@ -0,0 +1,115 @@
+"""
+Pico keyer firmware for the Automated Prayer Project (MicroPython)
+
+Copy this to a Raspberry Pi Pico as main.py, plug the Pico into the Pi's
+USB port, and set Config.PICO_PORT (e.g. "/dev/ttyACM0") in
+st_michael_telegraph.py. The sounder's transistor or relay is then driven
+from the Pico's KEY_PIN instead of the Pi's GPIO.
+
+The Pi sends each prayer as a list of segments; a PIO state machine holds
+the pin at each segment's level for its duration, counted in 1 MHz clock
+cycles. Once a prayer is queued, nothing on either side can disturb its
+timing.
+
+Protocol (USB serial, little-endian):
+    Pi -> Pico:  b"P", uint16 word count, then that many uint32 words,
+                 each (duration_us << 1) | level
+    Pi -> Pico:  b"X" while a plan is keying, to stop it with the key up
+    Pico -> Pi:  b"K" once the last segment has been keyed out, or stopped
+"""
+
+import select
+import struct
+import sys
+import time
+
+import micropython
+import rp2
+from machine import Pin
+
+# GPIO driving the sounder's transistor base (via 1k) or relay input
+KEY_PIN = 15
+
+# Cycles the program spends per segment outside the hold loop
+# (pull, out pins, out x, and the loop's final pass)
+OVERHEAD_US = 4
+
+# Depth of a state machine's TX FIFO, in words
+FIFO_DEPTH = 4
+
+
+@rp2.asm_pio(out_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_RIGHT)
+def keyer():
+    pull(block)
+    out(pins, 1)        # bit 0: level
+    out(x, 31)          # bits 1-31: hold time, in cycles
+    label("hold")
+    jmp(x_dec, "hold")
+
+
+def read_exact(stream, n):
+    data = b""
+    while len(data) < n:
+        data += stream.read(n - len(data))
+    return data
+
+
+def start_keyer():
+    """(Re)start the state machine with an empty FIFO and the key up."""
+    # 1 MHz, so one pass of the hold loop is one microsecond
+    sm = rp2.StateMachine(0, keyer, freq=1_000_000, out_base=Pin(KEY_PIN))
+    sm.active(1)
+    sm.put(0)
+    return sm
+
+
+def key_out(sm, words, abort_requested):
+    """Feed a plan to the state machine. Returns False if it was aborted."""
+    duration_us = 0
+    for word in words:
+        duration_us = max((word >> 1) - OVERHEAD_US, 0)
+        # Segments are far longer than it takes to refill the FIFO, so
+        # polling for an abort while it's full costs nothing
+        while sm.tx_fifo() >= FIFO_DEPTH:
+            if abort_requested():
+                return False
+        sm.put(duration_us << 1 | (word & 1))
+
+    # Empty FIFO = the last segment has started; wait out its hold
+    while sm.tx_fifo():
+        if abort_requested():
+            return False
+    end = time.ticks_add(time.ticks_us(), duration_us + OVERHEAD_US)
+    while time.ticks_diff(end, time.ticks_us()) > 0:
+        if abort_requested():
+            return False
+    return True
+
+
+def main():
+    # Plans are binary; a 0x03 byte must not raise KeyboardInterrupt
+    micropython.kbd_intr(-1)
+
+    sm = start_keyer()
+
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    poll = select.poll()
+    poll.register(sys.stdin, select.POLLIN)
+
+    def abort_requested():
+        return bool(poll.poll(0)) and stdin.read(1) == b"X"
+
+    while True:
+        if read_exact(stdin, 1) != b"P":
+            continue
+        count, = struct.unpack("<H", read_exact(stdin, 2))
+        words = struct.unpack(f"<{count}I", read_exact(stdin, 4 * count))
+
+        if not key_out(sm, words, abort_requested):
+            sm.active(0)
+            sm = start_keyer()
+        stdout.write(b"K")
+
+
+main()
@@ -22,9 +22,23 @@ License: HESSLA (Hacktivismo Enhanced-Source Software License Agreement)
 Who is like unto God?
 """
 
+import asyncio
+import ctypes
+import errno
+import math
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
 import time
+import unicodedata
+from array import array
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Protocol
 from enum import Enum
 
 # =============================================================================
@@ -47,6 +61,39 @@ class Config:
     
     # Print prayers to console as they're sent
     VERBOSE = True
+    
+    # Hand whole prayers to the pigpio daemon as DMA-timed waveforms
+    # when pigpiod is running (falls back to RPi.GPIO otherwise)
+    USE_PIGPIO = True
+    
+    # sysfs chip for the kernel pwm-gpio driver, e.g. "/sys/class/pwm/pwmchip2"
+    # (None to skip). Requires a pwm-gpio overlay bound to GPIO_PIN.
+    PWM_CHIP = None
+    PWM_CHANNEL = 0
+    
+    # GPIO character device for libgpiod
+    GPIO_CHIP = "/dev/gpiochip0"
+    
+    # Serial port of a Raspberry Pi Pico running pico_keyer.py, e.g.
+    # "/dev/ttyACM0" (None to key from the Pi's own GPIO)
+    PICO_PORT = None
+    
+    # Send a keyed CW sidetone to the sound card (ALSA) instead of the
+    # sounder - e.g. into a transceiver's mic/data input for MCW
+    TONE_ENABLED = False
+    TONE_HZ = 700
+    TONE_DEVICE = "default"
+    
+    # SCHED_FIFO priority for the transmit thread (None for normal
+    # scheduling). Needs root or CAP_SYS_NICE; falls back quietly without.
+    TX_RT_PRIORITY = 50
+    
+    # Pin the transmit thread to one CPU, e.g. 3 (None to leave it alone)
+    TX_CPU = None
+    
+    # Sleep to absolute deadlines with libc's clock_nanosleep (Linux only).
+    # Set False to use time.sleep, e.g. on a libc where it misbehaves.
+    USE_CLOCK_NANOSLEEP = True
 
 
 # =============================================================================
@@ -69,13 +116,36 @@ MORSE_CODE = {
     '&': '.-...',  ':': '---...', ';': '-.-.-.', '=': '-...-',
     '+': '.-.-.',  '-': '-....-', '_': '..--.-', '"': '.-..-.',
     '$': '...-..-','@': '.--.-.', ' ': ' ',  # space handled specially
-    
-    # Latin special characters - rendered as base letters
-    # (Traditional Morse didn't have these, we simplify)
-    'Á': '.-',     'É': '.',      'Í': '..',     'Ó': '---',
-    'Ú': '..-',    'Æ': '.-.-',   'Œ': '---.',
 }
 
+# Latin special characters - rendered as base letters
+# (Traditional Morse didn't have these, we simplify). Ligatures are spelled
+# out; accented letters are decomposed once, here, into the table below.
+_LIGATURES = (('Æ', 'AE'), ('Ǽ', 'AE'), ('Œ', 'OE'))
+
+# Latin-1, Latin Extended-A/B and Latin Extended Additional
+_LATIN_BLOCKS = (range(0x0000, 0x0250), range(0x1E00, 0x1F00))
+
+
+def _build_morse_table() -> dict[str, tuple[str, str]]:
+    """Map every sendable character straight to its (letter, pattern) pair."""
+    table = {}
+    for char in (chr(i) for block in _LATIN_BLOCKS for i in block):
+        # NFKD splits 'Á' into 'A' + combining accent; the ASCII encode
+        # then drops the accent
+        base = unicodedata.normalize('NFKD', char)
+        base = base.encode('ascii', 'ignore').decode()
+        # Spacing accents like '´' decompose to a space plus a combining
+        # mark; only real whitespace may become a word gap
+        if base == ' ' and not char.isspace():
+            continue
+        if base in MORSE_CODE:
+            table[char] = (base, MORSE_CODE[base])
+    return table
+
+
+_MORSE_TABLE = _build_morse_table()
+
 
 def text_to_morse(text: str) -> list[tuple[str, str]]:
     """
@@ -83,136 +153,755 @@ def text_to_morse(text: str) -> list[tuple[str, str]]:
     Returns list of (character, morse_pattern) tuples.
     Unknown characters are skipped.
     """
-    result = []
-    for char in text.upper():
-        if char in MORSE_CODE:
-            result.append((char, MORSE_CODE[char]))
-        elif char in 'ÀÂÄÃÅĀĂĄ':
-            result.append((char, MORSE_CODE['A']))
-        elif char in 'ÈÊËĒĔĖĘĚ':
-            result.append((char, MORSE_CODE['E']))
-        elif char in 'ÌÎÏĪĬĮĨ':
-            result.append((char, MORSE_CODE['I']))
-        elif char in 'ÒÔÖÕŌŎŐ':
-            result.append((char, MORSE_CODE['O']))
-        elif char in 'ÙÛÜŪŬŮŰŲ':
-            result.append((char, MORSE_CODE['U']))
-        # Skip unknown characters silently (punctuation we don't have, etc.)
-    return result
+    text = text.upper()
+    for ligature, letters in _LIGATURES:
+        text = text.replace(ligature, letters)
+    return [pair for char in text if (pair := _MORSE_TABLE.get(char))]
+
+
+# GPIO levels used in compiled keying plans
+HIGH = 1
+LOW = 0
+
+
+# A compiled keying plan is a bytes string of one-byte opcodes, which don't
+# depend on the keying speed. Each opcode holds the key at a GPIO level for
+# a number of units.
+Plan = bytes
+
+DIT, DAH, ELEMENT_GAP, LETTER_GAP, WORD_GAP, END = range(6)
+
+# (level, units) for each opcode, indexed by opcode
+_OPCODES = (
+    (HIGH, 1),  # DIT
+    (HIGH, 3),  # DAH
+    (LOW, 1),   # ELEMENT_GAP
+    (LOW, 3),   # LETTER_GAP
+    (LOW, 7),   # WORD_GAP
+    (LOW, 0),   # END - key up
+)
+
+
+def _letter_ops(pattern: str) -> bytes:
+    """The opcodes for one letter: its elements, with ELEMENT_GAP between."""
+    return bytes([ELEMENT_GAP]).join(
+        bytes([DIT if element == '.' else DAH]) for element in pattern
+    )
+
+
+# Each letter's opcodes, worked out once from MORSE_CODE
+_LETTER_OPS = {
+    pattern: _letter_ops(pattern)
+    for pattern in MORSE_CODE.values() if pattern != ' '
+}
+_LETTER_GAP_OP = bytes([LETTER_GAP])
+_WORD_GAP_OP = bytes([WORD_GAP])
+_END_OP = bytes([END])
+
+
+@lru_cache(maxsize=None)
+def _compile(text: str) -> Plan:
+    """
+    Compile text into a keying plan for the sounder.
+    Letters are separated by LETTER_GAP, words by a single WORD_GAP, and
+    the plan always finishes with END.
+    """
+    words = []
+    letters = []
+    for char, pattern in text_to_morse(text):
+        if char == ' ':
+            if letters:
+                words.append(_LETTER_GAP_OP.join(letters))
+                letters = []
+        else:
+            letters.append(_LETTER_OPS[pattern])
+    if letters:
+        words.append(_LETTER_GAP_OP.join(letters))
+    
+    return _WORD_GAP_OP.join(words) + _END_OP
+
+
+@lru_cache(maxsize=None)
+def _plan_units(plan: Plan) -> int:
+    """How long a keying plan takes to send, in Morse units."""
+    return sum(_OPCODES[op][1] for op in plan)
+
+
+@lru_cache(maxsize=None)
+def _transcript(text: str) -> str:
+    """The console echo of a transmission: a header and the letters sent."""
+    header = f"[MORSE] {text[:70]}{'...' if len(text) > 70 else ''}"
+    sent = ''.join(char for char, _ in text_to_morse(text))
+    return f"\n{header}\n{sent}\n"
+
+
+# =============================================================================
+# TIMING
+# =============================================================================
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+_TIMER_ABSTIME = 1
+
+
+@lru_cache(maxsize=None)
+def _load_clock_nanosleep():
+    """libc's clock_nanosleep, or None where it can't be used."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        clock_nanosleep = ctypes.CDLL(None, use_errno=True).clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+    clock_nanosleep.argtypes = [ctypes.c_int, ctypes.c_int,
+                                ctypes.POINTER(_Timespec), ctypes.c_void_p]
+    clock_nanosleep.restype = ctypes.c_int
+    return clock_nanosleep
+
+
+def _sleep_until_ns(deadline_ns: int, clock_nanosleep=None):
+    """
+    Sleep until time.monotonic_ns() reaches deadline_ns.
+    
+    Given libc's clock_nanosleep (see _load_clock_nanosleep), this is
+    clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME): the kernel wakes us
+    at the deadline itself, so there's no relative duration to go stale
+    between reading the clock and going to sleep. Otherwise time.sleep.
+    """
+    if clock_nanosleep is None:
+        remaining = deadline_ns - time.monotonic_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+        return
+    
+    ts = _Timespec(*divmod(deadline_ns, 1_000_000_000))
+    while clock_nanosleep(time.CLOCK_MONOTONIC, _TIMER_ABSTIME,
+                           ctypes.byref(ts), None) == errno.EINTR:
+        pass
 
 
 # =============================================================================
 # TELEGRAPH SOUNDER CONTROL
 # =============================================================================
 
+class _Backend(Protocol):
+    """A way of driving the sounder's GPIO pin."""
+    
+    name: str
+    
+    def set(self, level: int): ...
+    
+    def close(self): ...
+
+
+class _PigpioBackend:
+    """
+    pigpio daemon. Besides single edges, whole keying plans can be handed
+    off as DMA-timed waveforms (see send_waveform).
+    """
+    
+    name = "pigpio waveforms"
+    
+    def __init__(self, pin: int):
+        import pigpio
+        
+        self.pi = pigpio.pi()
+        if not self.pi.connected:
+            raise RuntimeError("pigpio daemon not running")
+        self._pigpio = pigpio
+        self.pin = pin
+        self.pi.set_mode(pin, pigpio.OUTPUT)
+        self.pi.write(pin, 0)
+    
+    def set(self, level: int):
+        self.pi.write(self.pin, level)
+    
+    def send_waveform(self, plan: Plan, unit_ms: int,
+                      interrupted: threading.Event):
+        """
+        Transmit a compiled keying plan as a single pigpio waveform.
+        The daemon clocks every edge out by DMA; this blocks until done,
+        or stops the wave early once interrupted is set.
+        """
+        pigpio = self._pigpio
+        mask = 1 << self.pin
+        # One pulse object per opcode, shared across the whole wave
+        op_pulses = tuple(
+            pigpio.pulse(mask, 0, units * unit_ms * 1000) if level
+            else pigpio.pulse(0, mask, units * unit_ms * 1000)
+            for level, units in _OPCODES
+        )
+        pulses = [op_pulses[op] for op in plan]
+        
+        self.pi.wave_clear()
+        self.pi.wave_add_generic(pulses)
+        wave_id = self.pi.wave_create()
+        try:
+            self.pi.wave_send_once(wave_id)
+            while self.pi.wave_tx_busy():
+                if interrupted.wait(0.05):
+                    self.pi.wave_tx_stop()
+                    self.pi.write(self.pin, 0)
+                    break
+        finally:
+            self.pi.wave_delete(wave_id)
+    
+    def close(self):
+        self.pi.wave_tx_stop()
+        self.pi.write(self.pin, 0)
+        self.pi.stop()
+
+
+class _PicoBackend:
+    """
+    A Raspberry Pi Pico running pico_keyer.py, over USB serial. The Pico's
+    PIO state machine clocks out every edge of a plan, so nothing on the
+    Linux side - scheduler, GC, GIL - can move them.
+    
+    Each segment goes over the wire as one little-endian 32-bit word,
+    (duration_us << 1) | level, after a b"P" and a 16-bit word count. The
+    Pico answers b"K" once the last segment has been keyed out, or as soon
+    as it has stopped after a b"X" abort.
+    """
+    
+    name = "Pico PIO keyer"
+    
+    # Seconds the Pico gets to answer beyond the plan's own duration
+    ACK_TIMEOUT = 2.0
+    
+    def __init__(self, port: str, baudrate: int = 115200):
+        import serial
+        
+        # Short reads, so waiting for an ack can watch for interrupts
+        self.port = serial.Serial(port, baudrate, timeout=0.05)
+        self.where = port
+        try:
+            self.set(0)
+        except Exception:
+            self.port.close()
+            raise
+    
+    def _send(self, words: list[int],
+              interrupted: Optional[threading.Event] = None):
+        self.port.reset_input_buffer()
+        self.port.write(b"P" + struct.pack(f"<H{len(words)}I", len(words), *words))
+        
+        duration = sum(word >> 1 for word in words) / 1e6
+        deadline = time.monotonic() + duration + self.ACK_TIMEOUT
+        while not (reply := self.port.read(1)):
+            if interrupted is not None and interrupted.is_set():
+                self.port.write(b"X")
+                interrupted = None
+                deadline = time.monotonic() + self.ACK_TIMEOUT
+            if time.monotonic() > deadline:
+                raise TimeoutError("no reply from Pico keyer "
+                                   "(is pico_keyer.py running?)")
+        if reply != b"K":
+            raise RuntimeError("Pico keyer did not acknowledge")
+    
+    def set(self, level: int):
+        self._send([level])
+    
+    def send_waveform(self, plan: Plan, unit_ms: int,
+                      interrupted: threading.Event):
+        """
+        Ship a whole plan to the Pico and wait while it keys it out,
+        telling it to stop if interrupted is set.
+        """
+        op_words = tuple((units * unit_ms * 1000) << 1 | level
+                         for level, units in _OPCODES)
+        self._send([op_words[op] for op in plan], interrupted)
+    
+    def close(self):
+        try:
+            self.set(0)
+        finally:
+            self.port.close()
+
+
+class _PwmGpioBackend:
+    """
+    In-kernel pwm-gpio driver through /sys/class/pwm. The channel is set up
+    once at 100% duty cycle, so keying is a single write to "enable" on a
+    file descriptor that stays open.
+    """
+    
+    name = "pwm-gpio"
+    
+    PERIOD_NS = 1_000_000
+    
+    def __init__(self, chip: str, channel: int):
+        self.path = os.path.join(chip, f"pwm{channel}")
+        if not os.path.isdir(self.path):
+            with open(os.path.join(chip, "export"), "w") as f:
+                f.write(str(channel))
+        self._write("period", self.PERIOD_NS)
+        self._write("duty_cycle", self.PERIOD_NS)
+        self._enable = os.open(os.path.join(self.path, "enable"), os.O_WRONLY)
+        self.set(0)
+    
+    def _write(self, attr: str, value: int):
+        with open(os.path.join(self.path, attr), "w") as f:
+            f.write(str(value))
+    
+    def set(self, level: int):
+        os.pwrite(self._enable, b"1" if level else b"0", 0)
+    
+    def close(self):
+        self.set(0)
+        os.close(self._enable)
+
+
+class _GpioMemBackend:
+    """
+    BCM283x/BCM2711 GPIO registers mapped through /dev/gpiomem (Pi 1-4, no
+    root needed). Keying is a single 32-bit store to GPSET0 or GPCLR0, with
+    no library or syscall in between.
+    """
+    
+    name = "/dev/gpiomem"
+    
+    # Register word offsets (BCM2835 ARM Peripherals, section 6.1)
+    GPFSEL0 = 0x00 // 4
+    GPSET0 = 0x1C // 4
+    GPCLR0 = 0x28 // 4
+    
+    def __init__(self, pin: int, path: str = "/dev/gpiomem"):
+        if not 0 <= pin < 32:
+            raise ValueError(f"GPIO {pin} is not in bank 0")
+        try:
+            with open("/proc/device-tree/compatible", "rb") as f:
+                if b"bcm2712" in f.read():
+                    raise RuntimeError("Pi 5 GPIO is on the RP1, not mapped here")
+        except FileNotFoundError:
+            pass
+        
+        fd = os.open(path, os.O_RDWR | os.O_SYNC)
+        try:
+            self._mem = mmap.mmap(fd, 4096, mmap.MAP_SHARED,
+                                  mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        self._regs = memoryview(self._mem).cast("I")
+        self._bit = 1 << pin
+        
+        # Function select: 3 bits per pin, 001 = output
+        fsel = self.GPFSEL0 + pin // 10
+        shift = (pin % 10) * 3
+        self._regs[fsel] = (self._regs[fsel] & ~(0b111 << shift)) | (0b001 << shift)
+        self.set(0)
+    
+    def set(self, level: int):
+        self._regs[self.GPSET0 if level else self.GPCLR0] = self._bit
+    
+    def close(self):
+        self.set(0)
+        self._regs.release()
+        self._mem.close()
+
+
+class _GpiodBackend:
+    """
+    libgpiod v2 character device. The line request is held open for the
+    life of the sounder rather than re-requested on every edge.
+    """
+    
+    name = "gpiod"
+    
+    def __init__(self, pin: int, chip: str):
+        import gpiod
+        from gpiod.line import Direction, Value
+        
+        self._active = Value.ACTIVE
+        self._inactive = Value.INACTIVE
+        self.pin = pin
+        self.request = gpiod.request_lines(
+            chip,
+            consumer="morse",
+            config={pin: gpiod.LineSettings(direction=Direction.OUTPUT,
+                                            output_value=Value.INACTIVE)},
+        )
+    
+    def set(self, level: int):
+        self.request.set_value(self.pin, self._active if level else self._inactive)
+    
+    def close(self):
+        self.set(0)
+        self.request.release()
+
+
+class _RPiGPIOBackend:
+    """Classic RPi.GPIO (Pi 4 and earlier)."""
+    
+    name = "RPi.GPIO"
+    
+    def __init__(self, pin: int):
+        import RPi.GPIO as GPIO
+        
+        self.gpio = GPIO
+        self.pin = pin
+        self.gpio.setmode(GPIO.BCM)
+        self.gpio.setup(self.pin, GPIO.OUT)
+        self.gpio.output(self.pin, GPIO.LOW)
+    
+    def set(self, level: int):
+        self.gpio.output(self.pin, self.gpio.HIGH if level else self.gpio.LOW)
+    
+    def close(self):
+        self.gpio.cleanup()
+
+
 class Sounder:
     """
     Controls the telegraph sounder via GPIO or simulates in console.
+    
+    Backends are tried in order of preference: a Pico keyer (if a serial
+    port is configured), pigpio waveforms, the kernel pwm-gpio driver (if
+    a chip is configured), direct register writes through /dev/gpiomem,
+    libgpiod, and finally RPi.GPIO. If none can be set up, the sounder is
+    simulated.
     """
     
-    def __init__(self, pin: int, hardware_enabled: bool = False):
+    def __init__(self, pin: int, hardware_enabled: bool = False,
+                 use_pigpio: bool = True, pwm_chip: Optional[str] = None,
+                 pwm_channel: int = 0, gpio_chip: str = "/dev/gpiochip0",
+                 pico_port: Optional[str] = None):
         self.pin = pin
         self.hardware_enabled = hardware_enabled
-        self.gpio = None
+        self.backend: Optional[_Backend] = None
+        
+        if not self.hardware_enabled:
+            return
+        
+        candidates = []
+        if pico_port:
+            candidates.append(("Pico keyer", lambda: _PicoBackend(pico_port)))
+        if use_pigpio:
+            candidates.append(("pigpio", lambda: _PigpioBackend(pin)))
+        if pwm_chip:
+            candidates.append(("pwm-gpio", lambda: _PwmGpioBackend(pwm_chip, pwm_channel)))
+        candidates.append(("/dev/gpiomem", lambda: _GpioMemBackend(pin)))
+        candidates.append(("gpiod", lambda: _GpiodBackend(pin, gpio_chip)))
+        candidates.append(("RPi.GPIO", lambda: _RPiGPIOBackend(pin)))
         
-        if self.hardware_enabled:
+        for name, factory in candidates:
             try:
-                import RPi.GPIO as GPIO
-                self.gpio = GPIO
-                self.gpio.setmode(GPIO.BCM)
-                self.gpio.setup(self.pin, GPIO.OUT)
-                self.gpio.output(self.pin, GPIO.LOW)
-                print(f"[SOUNDER] Initialized on GPIO {self.pin}")
+                self.backend = factory()
+                # Backends keying something other than our own pin say where
+                where = getattr(self.backend, "where", f"GPIO {self.pin}")
+                print(f"[SOUNDER] Initialized on {where} ({self.backend.name})")
+                return
             except ImportError:
-                print("[SOUNDER] RPi.GPIO not available, falling back to simulation")
-                self.hardware_enabled = False
+                print(f"[SOUNDER] {name} not available")
             except Exception as e:
-                print(f"[SOUNDER] GPIO setup failed: {e}, falling back to simulation")
-                self.hardware_enabled = False
+                print(f"[SOUNDER] {name} setup failed: {e}")
+        
+        print("[SOUNDER] No GPIO backend available, falling back to simulation")
+        self.hardware_enabled = False
+    
+    @property
+    def supports_waveforms(self) -> bool:
+        """True if send_waveform can hand plans off to hardware timing."""
+        return hasattr(self.backend, "send_waveform")
     
     def key_down(self):
         """Close the circuit - sounder clicks"""
-        if self.hardware_enabled and self.gpio:
-            self.gpio.output(self.pin, self.gpio.HIGH)
+        if self.backend:
+            self.backend.set(HIGH)
     
     def key_up(self):
         """Open the circuit - sounder releases"""
-        if self.hardware_enabled and self.gpio:
-            self.gpio.output(self.pin, self.gpio.LOW)
+        if self.backend:
+            self.backend.set(LOW)
     
-    def cleanup(self):
-        """Release GPIO resources"""
-        if self.hardware_enabled and self.gpio:
-            self.gpio.cleanup()
+    def set_level(self, level: int):
+        """Drive the sounder to a GPIO level (HIGH = key down)"""
+        if self.backend:
+            self.backend.set(level)
     
-    def dit(self, unit_ms: int):
-        """Send a dit (dot) - 1 unit"""
-        self.key_down()
-        time.sleep(unit_ms / 1000)
-        self.key_up()
+    def send_waveform(self, plan: Plan, unit_ms: int,
+                      interrupted: threading.Event):
+        """
+        Transmit a compiled keying plan with hardware timing, stopping
+        early if interrupted is set.
+        """
+        self.backend.send_waveform(plan, unit_ms, interrupted)
     
-    def dah(self, unit_ms: int):
-        """Send a dah (dash) - 3 units"""
-        self.key_down()
-        time.sleep((unit_ms * 3) / 1000)
-        self.key_up()
+    def cleanup(self):
+        """Release GPIO resources"""
+        if self.backend:
+            self.backend.close()
+            self.backend = None
 
 
 class MorseTransmitter:
     """
     Transmits text as Morse code through a Sounder.
+    
+    Work handed to submit() runs on a dedicated transmit thread, which
+    asks for SCHED_FIFO real-time scheduling (needs root or CAP_SYS_NICE)
+    so its wakeups aren't delayed behind other processes.
     """
     
-    def __init__(self, sounder: Sounder, unit_ms: int = 80, verbose: bool = True):
+    # Sleep until this close to a deadline, then spin for the rest (ns)
+    SPIN_THRESHOLD_NS = 500_000
+    SPIN_MARGIN_NS = 300_000
+    
+    def __init__(self, sounder: Sounder, unit_ms: int = 80, verbose: bool = True,
+                 rt_priority: Optional[int] = None, cpu: Optional[int] = None,
+                 use_clock_nanosleep: bool = True):
         self.sounder = sounder
         self.unit_ms = unit_ms
         self.verbose = verbose
+        self.rt_priority = rt_priority
+        self.cpu = cpu
+        self._clock_nanosleep = _load_clock_nanosleep() if use_clock_nanosleep else None
+        self._interrupted = threading.Event()
+        self._inbox: queue.Queue = queue.Queue()
+        self._tx_thread: Optional[threading.Thread] = None
+    
+    @property
+    def unit_ms(self) -> int:
+        return self._unit_ms
+    
+    @unit_ms.setter
+    def unit_ms(self, unit_ms: int):
+        self._unit_ms = unit_ms
+        # Each opcode's duration, worked out once in integer ns so the
+        # keying loop never multiplies or divides
+        self._ops = tuple((level, units * unit_ms * 1_000_000)
+                          for level, units in _OPCODES)
     
     def send_text(self, text: str):
         """Send a complete text string as Morse code."""
+        self._transmit(text, _compile(text))
+    
+    def send_compiled(self, key: "PlanKey"):
+        """
+        Send one of the fixed prayers, using its precompiled plan (and
+        whatever prepare() already got ready for it).
+        """
+        self._transmit(PRAYER_TEXTS[key], _COMPILED[key])
+    
+    def prepare(self, key: "PlanKey") -> Plan:
+        """
+        Get one of the fixed prayers ready to send. Called ahead of time,
+        while the previous prayer's pause is running.
+        """
+        return _COMPILED[key]
+    
+    def interrupt(self):
+        """Cut short the transmission in progress (from another thread)."""
+        self._interrupted.set()
+    
+    def submit(self, fn, *args) -> Future:
+        """Run fn(*args) on the transmit thread, starting it if needed."""
+        # Cleared here rather than on the transmit thread, so an interrupt()
+        # arriving after this can't be lost
+        self._interrupted.clear()
+        if self._tx_thread is None:
+            self._tx_thread = threading.Thread(target=self._tx_loop,
+                                               name="morse-tx", daemon=True)
+            self._tx_thread.start()
+        
+        future = Future()
+        self._inbox.put((fn, args, future))
+        return future
+    
+    def shutdown(self):
+        """Stop the transmit thread once its queued work is done."""
+        if self._tx_thread is not None:
+            self._inbox.put(None)
+            self._tx_thread.join()
+            self._tx_thread = None
+        self._interrupted.clear()
+    
+    def _tx_loop(self):
+        """The transmit thread: run queued work, in order, until shut down."""
+        self._setup_tx_thread()
+        while (item := self._inbox.get()) is not None:
+            fn, args, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def _setup_tx_thread(self):
+        """Ask for real-time scheduling and CPU pinning, where allowed."""
+        if self.rt_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.rt_priority))
+                print(f"[TX] Real-time scheduling (SCHED_FIFO, priority {self.rt_priority})")
+            except AttributeError:
+                print("[TX] Real-time scheduling not supported on this platform")
+            except PermissionError:
+                print("[TX] No permission for real-time scheduling (needs CAP_SYS_NICE), "
+                      "using normal scheduling")
+            except OSError as e:
+                print(f"[TX] Real-time scheduling failed: {e}, using normal scheduling")
+        
+        if self.cpu is not None:
+            try:
+                os.sched_setaffinity(0, {self.cpu})
+                print(f"[TX] Pinned to CPU {self.cpu}")
+            except (AttributeError, OSError) as e:
+                print(f"[TX] Could not pin to CPU {self.cpu}: {e}")
+    
+    def _transmit(self, text: str, plan: Plan):
+        """Key out a compiled plan, echoing its text to the console."""
         if self.verbose:
-            print(f"\n[MORSE] {text[:70]}{'...' if len(text) > 70 else ''}")
+            # One write and one flush, before any edges go out
+            sys.stdout.write(_transcript(text))
+            sys.stdout.flush()
         
-        morse_sequence = text_to_morse(text)
+        self._key_out(plan)
+    
+    def _key_out(self, plan: Plan):
+        """Drive the sounder through a compiled plan."""
+        if self.sounder.supports_waveforms:
+            self.sounder.send_waveform(plan, self.unit_ms, self._interrupted)
+            return
         
-        for i, (char, pattern) in enumerate(morse_sequence):
-            if char == ' ':
-                # Word space: 7 units (but we've already done 3 after last letter)
-                # So add 4 more
-                time.sleep((self.unit_ms * 4) / 1000)
-                if self.verbose:
-                    print(' ', end='', flush=True)
+        # Edges are scheduled against absolute deadlines so that sleep
+        # overshoot on one element doesn't push back all the ones after it
+        ops = self._ops
+        deadline = time.monotonic_ns()
+        for op in plan:
+            if self._interrupted.is_set():
+                break
+            level, duration = ops[op]
+            self.sounder.set_level(level)
+            deadline += duration
+            self._wait_until(deadline)
+        self.sounder.key_up()
+    
+    def _wait_until(self, deadline_ns: int):
+        """Block until the monotonic clock reaches deadline_ns."""
+        remaining = deadline_ns - time.monotonic_ns()
+        if remaining > self.SPIN_THRESHOLD_NS:
+            _sleep_until_ns(deadline_ns - self.SPIN_MARGIN_NS, self._clock_nanosleep)
+        while time.monotonic_ns() < deadline_ns:
+            pass
+
+
+class ToneTransmitter(MorseTransmitter):
+    """
+    Transmits text as a keyed CW sidetone through ALSA, for feeding a
+    transceiver's audio input (MCW) or just listening along.
+    
+    Each prayer is rendered up front into one 16-bit PCM buffer, with
+    raised-cosine ramps on every key-down and key-up so the tone doesn't
+    click. The sound card's clock then owns the timing. Falls back to
+    keying the sounder if ALSA can't be opened.
+    """
+    
+    AMPLITUDE = 16000
+    PERIOD_FRAMES = 1024
+    
+    def __init__(self, sounder: Sounder, unit_ms: int = 80, verbose: bool = True,
+                 tone_hz: int = 700, sample_rate: int = 8000,
+                 ramp_ms: float = 5, device: str = "default",
+                 rt_priority: Optional[int] = None, cpu: Optional[int] = None,
+                 use_clock_nanosleep: bool = True):
+        super().__init__(sounder, unit_ms, verbose, rt_priority, cpu,
+                         use_clock_nanosleep)
+        self.tone_hz = tone_hz
+        self.sample_rate = sample_rate
+        self.ramp_samples = int(sample_rate * ramp_ms / 1000)
+        self.pcm = None
+        self._marks: dict[int, array] = {}
+        # The most recently prepared (plan, PCM) pair
+        self._rendered: Optional[tuple[Plan, bytes]] = None
+        
+        try:
+            import alsaaudio
+            self.pcm = alsaaudio.PCM(
+                alsaaudio.PCM_PLAYBACK,
+                device=device,
+                channels=1,
+                rate=sample_rate,
+                format=alsaaudio.PCM_FORMAT_S16_LE,
+                periodsize=self.PERIOD_FRAMES,
+            )
+            print(f"[TONE] {tone_hz} Hz sidetone on ALSA device '{device}'")
+        except ImportError:
+            print("[TONE] pyalsaaudio not available, keying the sounder instead")
+        except Exception as e:
+            print(f"[TONE] ALSA setup failed: {e}, keying the sounder instead")
+    
+    def _mark(self, samples: int) -> array:
+        """One key-down of the tone, with shaped rise and fall."""
+        mark = self._marks.get(samples)
+        if mark is None:
+            ramp = min(self.ramp_samples, samples // 2)
+            step = 2 * math.pi * self.tone_hz / self.sample_rate
+            mark = array('h')
+            for i in range(samples):
+                envelope = 1.0
+                edge = min(i, samples - 1 - i)
+                if edge < ramp:
+                    envelope = 0.5 - 0.5 * math.cos(math.pi * edge / ramp)
+                mark.append(int(self.AMPLITUDE * envelope * math.sin(step * i)))
+            self._marks[samples] = mark
+        return mark
+    
+    def render(self, plan: Plan) -> bytes:
+        """Render a compiled plan as S16_LE mono PCM, padded to whole periods."""
+        pcm = array('h')
+        start = 0
+        elapsed_units = 0
+        for op in plan:
+            level, units = _OPCODES[op]
+            elapsed_units += units
+            end = elapsed_units * self.unit_ms * self.sample_rate // 1000
+            if level:
+                pcm += self._mark(end - start)
             else:
-                self._send_character(pattern)
-                if self.verbose:
-                    print(char, end='', flush=True)
-                
-                # Inter-letter space: 3 units (but we've already done 1 after last element)
-                # Check if next char is not a space
-                if i + 1 < len(morse_sequence) and morse_sequence[i + 1][0] != ' ':
-                    time.sleep((self.unit_ms * 2) / 1000)
+                pcm.frombytes(bytes(2 * (end - start)))
+            start = end
         
-        if self.verbose:
-            print()  # newline at end
-    
-    def _send_character(self, pattern: str):
-        """Send a single character's morse pattern."""
-        for j, element in enumerate(pattern):
-            if element == '.':
-                self.sounder.dit(self.unit_ms)
-            elif element == '-':
-                self.sounder.dah(self.unit_ms)
-            
-            # Inter-element space: 1 unit (if not last element)
-            if j < len(pattern) - 1:
-                time.sleep(self.unit_ms / 1000)
+        pcm.frombytes(bytes(2 * (-len(pcm) % self.PERIOD_FRAMES)))
+        if sys.byteorder == "big":
+            pcm.byteswap()
+        return pcm.tobytes()
+    
+    def prepare(self, key: "PlanKey") -> Plan:
+        plan = super().prepare(key)
+        if self.pcm is not None:
+            # Only the next prayer is kept; a long one is megabytes of PCM
+            self._rendered = (plan, self.render(plan))
+        return plan
+    
+    def _key_out(self, plan: Plan):
+        if self.pcm is None:
+            super()._key_out(plan)
+            return
+        
+        if self._rendered and self._rendered[0] is plan:
+            data = self._rendered[1]
+        else:
+            data = self.render(plan)
+        self._rendered = None
+        
+        period_bytes = 2 * self.PERIOD_FRAMES
+        for i in range(0, len(data), period_bytes):
+            if self._interrupted.is_set():
+                self.pcm.drop()
+                return
+            self.pcm.write(data[i:i + period_bytes])
+        # Block until the last of it has actually played
+        self.pcm.drain()
 
 
 # =============================================================================
 # THE CHAPLET OF ST. MICHAEL - PRAYER TEXTS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Salutation:
     """One of the nine salutations to the angelic choirs."""
     choir: str
@@ -431,6 +1120,40 @@ FINAL_INVOCATION = {
 }
 
 
+# Every fixed prayer text, keyed by (text_id, language)
+PlanKey = tuple[str, str]
+
+
+def _all_prayer_texts():
+    """Yield (key, text) for every fixed prayer in the Chaplet."""
+    prayers = {
+        "OPENING_PRAYER": OPENING_PRAYER,
+        "GLORY_BE": GLORY_BE,
+        "OUR_FATHER": OUR_FATHER,
+        "HAIL_MARY": HAIL_MARY,
+        "CLOSING_PRAYER": CLOSING_PRAYER,
+        "FINAL_INVOCATION": FINAL_INVOCATION,
+    }
+    for text_id, prayer_dict in prayers.items():
+        for lang, text in prayer_dict.items():
+            yield (text_id, lang), text
+    
+    for i, salutation in enumerate(SALUTATIONS, 1):
+        yield (f"SALUTATION_{i}", "english"), salutation.prayer_english
+        yield (f"SALUTATION_{i}", "latin"), salutation.prayer_latin
+
+
+# Interned, so every lookup of a prayer hands back the one shared string
+PRAYER_TEXTS: dict[PlanKey, str] = {
+    key: sys.intern(text) for key, text in _all_prayer_texts()
+}
+
+# The prayers never change, so compile them all once up front
+_COMPILED: dict[PlanKey, Plan] = {
+    key: _compile(text) for key, text in PRAYER_TEXTS.items()
+}
+
+
 # =============================================================================
 # MAIN PRAYER CYCLE
 # =============================================================================
@@ -446,100 +1169,107 @@ class ChapletOfStMichael:
         self.language = language  # "latin", "english", or "alternating"
         self.inter_prayer_delay = inter_prayer_delay
         self.cycle_count = 0
+        # When the current prayer's pause ends, on the monotonic clock
+        self._next_ns = 0
     
-    def get_text(self, prayer_dict: dict, salutation: Optional[Salutation] = None,
-                 attr: Optional[str] = None) -> str:
-        """Get prayer text in appropriate language."""
-        if self.language == "alternating":
-            # Alternate based on cycle count
-            lang = "latin" if self.cycle_count % 2 == 0 else "english"
-        else:
-            lang = self.language
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _cycle_plan(lang: str) -> tuple[tuple[str, PlanKey], ...]:
+        """
+        The whole Chaplet in one language, as (label, prayer key) pairs.
+        
+        Structure:
+            1. Opening prayer and Glory Be
+            2. Nine salutations (each followed by Our Father + 3 Hail Marys)
+            3. Four Our Fathers for the Archangels and Guardian Angel
+            4. Closing prayer
+            5. Final invocation
+        """
+        plan = [
+            ("OPENING", ("OPENING_PRAYER", lang)),
+            ("GLORY BE", ("GLORY_BE", lang)),
+        ]
+        
+        for i, salutation in enumerate(SALUTATIONS, 1):
+            plan.append((f"SALUTATION {i}/9: {salutation.choir.upper()}",
+                         (f"SALUTATION_{i}", lang)))
+            plan.append(("OUR FATHER", ("OUR_FATHER", lang)))
+            for hail_mary_num in range(1, 4):
+                plan.append((f"HAIL MARY {hail_mary_num}/3", ("HAIL_MARY", lang)))
         
-        if salutation and attr:
-            return getattr(salutation, f"prayer_{lang}")
-        return prayer_dict.get(lang, prayer_dict.get("latin"))
+        for dedication in CLOSING_OUR_FATHERS:
+            plan.append((f"OUR FATHER - In honor of {dedication['dedicatee']}",
+                         ("OUR_FATHER", lang)))
+        
+        plan.append(("CLOSING PRAYER", ("CLOSING_PRAYER", lang)))
+        plan.append(("FINAL INVOCATION", ("FINAL_INVOCATION", lang)))
+        return tuple(plan)
     
     def pray(self):
+        """Execute one complete Chaplet cycle."""
+        asyncio.run(self.pray_async())
+    
+    async def pray_async(self):
         """
-        Execute one complete Chaplet cycle.
+        Execute one complete Chaplet cycle on the running event loop.
         
-        Structure:
-            1. Opening prayer
-            2. Nine salutations (each followed by Our Father)
-            3. Closing prayer
-            4. Final invocation
+        Each prayer is keyed out on the transmitter's thread. While the
+        pause after it runs, the same thread prepares the next prayer, so
+        its compile (or render) cost is absorbed by the pause.
+        
+        Pauses end at absolute deadlines worked out from each prayer's
+        known length, so time lost in one prayer doesn't push back the
+        rest of the cycle.
         """
+        transmitter = self.transmitter
         self.cycle_count += 1
         
+        if self.language == "alternating":
+            # Alternate based on cycle count
+            lang = "latin" if self.cycle_count % 2 == 0 else "english"
+        else:
+            lang = self.language
+        
         print(f"\n{'='*60}")
         print(f"CHAPLET OF ST. MICHAEL - CYCLE {self.cycle_count}")
         print(f"Language: {self.language}")
         print(f"{'='*60}")
         
-        # Opening
-        print("\n[OPENING]")
-        self.transmitter.send_text(self.get_text(OPENING_PRAYER))
-        time.sleep(self.inter_prayer_delay)
-        
-        # Glory Be
-        print("\n[GLORY BE]")
-        self.transmitter.send_text(self.get_text(GLORY_BE))
-        time.sleep(self.inter_prayer_delay)
-        
-        # Nine Salutations
-        for i, salutation in enumerate(SALUTATIONS, 1):
-            print(f"\n[SALUTATION {i}/9: {salutation.choir.upper()}]")
+        plan = self._cycle_plan(lang)
+        self._next_ns = time.monotonic_ns()
+        for n, (label, key) in enumerate(plan):
+            print(f"\n[{label}]")
+            await asyncio.wrap_future(transmitter.submit(transmitter.send_compiled, key))
             
-            # The salutation prayer
-            if self.language == "alternating":
-                lang = "latin" if self.cycle_count % 2 == 0 else "english"
-            else:
-                lang = self.language
-            
-            prayer = getattr(salutation, f"prayer_{lang}")
-            self.transmitter.send_text(prayer)
-            time.sleep(self.inter_prayer_delay)
-            
-            # Our Father (1x)
-            print(f"\n[OUR FATHER]")
-            self.transmitter.send_text(self.get_text(OUR_FATHER))
-            time.sleep(self.inter_prayer_delay)
-            
-            # Hail Mary (3x)
-            for hail_mary_num in range(1, 4):
-                print(f"\n[HAIL MARY {hail_mary_num}/3]")
-                self.transmitter.send_text(self.get_text(HAIL_MARY))
-                time.sleep(self.inter_prayer_delay)
-        
-        # Four Our Fathers in honor of the Archangels and Guardian Angel
-        for dedication in CLOSING_OUR_FATHERS:
-            if self.language == "alternating":
-                lang = "latin" if self.cycle_count % 2 == 0 else "english"
-            else:
-                lang = self.language
-            
-            if lang == "latin":
-                dedicatee = dedication["dedicatee_latin"]
-            else:
-                dedicatee = dedication["dedicatee"]
-            
-            print(f"\n[OUR FATHER - In honor of {dedication['dedicatee']}]")
-            self.transmitter.send_text(self.get_text(OUR_FATHER))
-            time.sleep(self.inter_prayer_delay)
-        
-        # Closing prayer
-        print("\n[CLOSING PRAYER]")
-        self.transmitter.send_text(self.get_text(CLOSING_PRAYER))
-        time.sleep(self.inter_prayer_delay)
-        
-        # Final invocation
-        print("\n[FINAL INVOCATION]")
-        self.transmitter.send_text(self.get_text(FINAL_INVOCATION))
+            if n + 1 < len(plan):
+                next_key = plan[n + 1][1]
+                prepared = asyncio.wrap_future(transmitter.submit(transmitter.prepare, next_key))
+                self._next_ns += (_plan_units(_COMPILED[key]) * transmitter.unit_ms * 1_000_000
+                                  + self.inter_prayer_delay * 1_000_000_000)
+                await asyncio.sleep(max(0, self._next_ns - time.monotonic_ns()) / 1e9)
+                await prepared
         
         print(f"\n{'='*60}")
         print(f"CYCLE {self.cycle_count} COMPLETE")
         print(f"{'='*60}\n")
+    
+    def close(self):
+        """Stop any transmission in progress and wait for the thread to finish."""
+        self.transmitter.interrupt()
+        self.transmitter.shutdown()
+
+
+async def pray_without_ceasing(chaplet: ChapletOfStMichael):
+    """Run Chaplet cycles forever, with a rest between each."""
+    # Flag anything that blocks the loop for long (with PYTHONASYNCIODEBUG=1)
+    asyncio.get_running_loop().slow_callback_duration = 0.005
+    
+    while True:
+        await chaplet.pray_async()
+        
+        # Brief pause between cycles
+        print(f"\n[PAUSE] Resting before next cycle...")
+        await asyncio.sleep(60)
 
 
 # =============================================================================
@@ -578,14 +1308,34 @@ def main():
     # Initialize hardware
     sounder = Sounder(
         pin=Config.GPIO_PIN,
-        hardware_enabled=Config.HARDWARE_ENABLED
+        hardware_enabled=Config.HARDWARE_ENABLED,
+        use_pigpio=Config.USE_PIGPIO,
+        pwm_chip=Config.PWM_CHIP,
+        pwm_channel=Config.PWM_CHANNEL,
+        gpio_chip=Config.GPIO_CHIP,
+        pico_port=Config.PICO_PORT
     )
     
-    transmitter = MorseTransmitter(
-        sounder=sounder,
-        unit_ms=Config.UNIT_MS,
-        verbose=Config.VERBOSE
-    )
+    if Config.TONE_ENABLED:
+        transmitter = ToneTransmitter(
+            sounder=sounder,
+            unit_ms=Config.UNIT_MS,
+            verbose=Config.VERBOSE,
+            tone_hz=Config.TONE_HZ,
+            device=Config.TONE_DEVICE,
+            rt_priority=Config.TX_RT_PRIORITY,
+            cpu=Config.TX_CPU,
+            use_clock_nanosleep=Config.USE_CLOCK_NANOSLEEP
+        )
+    else:
+        transmitter = MorseTransmitter(
+            sounder=sounder,
+            unit_ms=Config.UNIT_MS,
+            verbose=Config.VERBOSE,
+            rt_priority=Config.TX_RT_PRIORITY,
+            cpu=Config.TX_CPU,
+            use_clock_nanosleep=Config.USE_CLOCK_NANOSLEEP
+        )
     
     chaplet = ChapletOfStMichael(
         transmitter=transmitter,
@@ -595,15 +1345,11 @@ def main():
     
     try:
         # Pray without ceasing
-        while True:
-            chaplet.pray()
-            
-            # Brief pause between cycles
-            print(f"\n[PAUSE] Resting before next cycle...")
-            time.sleep(60)
-            
+        asyncio.run(pray_without_ceasing(chaplet))
+        
     except KeyboardInterrupt:
         print("\n\n[INTERRUPTED] Closing with final invocation...")
+        chaplet.close()
         transmitter.send_text("QUIS UT DEUS")
         
     finally: